@@ -1 +1,416 @@
-"""\nUFC Data Migration Script\n========================\n\nThis script migrates existing CSV data from the UFC project into the SQLite database.\nIt handles data cleaning, validation, and proper relationship mapping.\n\"\"\"\n\nimport pandas as pd\nimport numpy as np\nfrom datetime import datetime, date\nimport logging\nimport os\nimport sys\nfrom typing import Dict, List, Optional, Tuple\nimport re\n\nfrom database_schema import UFCDatabase\nfrom data_access_layer import UFCDataAccess\n\n# Configure logging\nlogging.basicConfig(\n    level=logging.INFO,\n    format='%(asctime)s - %(levelname)s - %(message)s'\n)\nlogger = logging.getLogger(__name__)\n\n\nclass UFCDataMigrator:\n    \"\"\"Handles migration of CSV data to the UFC database.\"\"\"\n    \n    def __init__(self, db_path: str = \"ufc_data.db\", data_dir: str = \".\"):\n        \"\"\"Initialize the migrator.\"\"\"\n        self.db_path = db_path\n        self.data_dir = data_dir\n        \n        # Initialize database schema first\n        db = UFCDatabase(db_path)\n        try:\n            db.create_tables()\n            db.create_indexes()\n            logger.info(\"Database schema initialized for migration\")\n        except Exception as e:\n            logger.error(f\"Failed to initialize database schema: {e}\")\n            raise\n        finally:\n            db.close()\n        \n        # Now initialize data access layer\n        self.dal = UFCDataAccess(db_path)\n        \n        # Track inserted records for reporting\n        self.migration_stats = {\n            'fighters': 0,\n            'weight_classes': 0,\n            'events': 0,\n            'fights': 0,\n            'fighter_stats': 0,\n            'betting_odds': 0,\n            'errors': []\n        }\n    \n    def close(self):\n        \"\"\"Close database connection.\"\"\"\n        self.dal.close()\n    \n    def clean_numeric_value(self, value) -> Optional[float]:\n        \"\"\"Clean and convert numeric values.\"\"\"\n        if pd.isna(value) or value == '' or value == 'NaN':\n            return None\n        try:\n            return float(value)\n        except (ValueError, TypeError):\n            return None\n    \n    def clean_string_value(self, value) -> Optional[str]:\n        \"\"\"Clean and convert string values.\"\"\"\n        if pd.isna(value) or value == '' or value == 'NaN':\n            return None\n        return str(value).strip()\n    \n    def clean_date_value(self, value) -> Optional[str]:\n        \"\"\"Clean and convert date values.\"\"\"\n        if pd.isna(value) or value == '' or value == 'NaN':\n            return None\n        \n        try:\n            # Try to parse the date and return in YYYY-MM-DD format\n            if isinstance(value, str):\n                # Handle various date formats\n                parsed_date = pd.to_datetime(value)\n                return parsed_date.strftime('%Y-%m-%d')\n            elif hasattr(value, 'strftime'):\n                return value.strftime('%Y-%m-%d')\n            else:\n                return str(value)\n        except:\n            logger.warning(f\"Could not parse date: {value}\")\n            return None\n    \n    def extract_height_in_inches(self, height_str) -> Optional[float]:\n        \"\"\"Extract height in inches from various formats.\"\"\"\n        if not height_str or pd.isna(height_str):\n            return None\n        \n        height_str = str(height_str).strip()\n        \n        # Handle format like \"5' 11\\\"\" or \"5'11\\\"\"\n        feet_inches_pattern = r\"(\\d+)'\\s*(\\d+)\"\n        match = re.search(feet_inches_pattern, height_str)\n        if match:\n            feet = int(match.group(1))\n            inches = int(match.group(2))\n            return feet * 12 + inches\n        \n        # Handle format like \"71\" (already in inches)\n        if height_str.replace('.', '').isdigit():\n            return float(height_str)\n        \n        return None\n    \n    def parse_weight_class_gender(self, weight_class: str) -> str:\n        \"\"\"Determine gender from weight class name.\"\"\"\n        if not weight_class:\n            return 'Mixed'\n        \n        weight_class_lower = weight_class.lower()\n        if \"women's\" in weight_class_lower:\n            return 'Female'\n        elif \"men's\" in weight_class_lower:\n            return 'Male'\n        else:\n            return 'Mixed'\n    \n    def migrate_weight_classes(self, df: pd.DataFrame):\n        \"\"\"Migrate weight classes from the dataframe.\"\"\"\n        logger.info(\"Migrating weight classes...\")\n        \n        unique_weight_classes = df['weight_class'].dropna().unique()\n        \n        for weight_class in unique_weight_classes:\n            try:\n                gender = self.parse_weight_class_gender(weight_class)\n                weight_class_id = self.dal.insert_weight_class(\n                    name=weight_class,\n                    gender=gender\n                )\n                self.migration_stats['weight_classes'] += 1\n                logger.debug(f\"Inserted weight class: {weight_class} (ID: {weight_class_id})\")\n                \n            except Exception as e:\n                error_msg = f\"Error inserting weight class {weight_class}: {e}\"\n                logger.error(error_msg)\n                self.migration_stats['errors'].append(error_msg)\n        \n        logger.info(f\"Migrated {self.migration_stats['weight_classes']} weight classes\")\n    \n    def migrate_fighters(self, df: pd.DataFrame):\n        \"\"\"Migrate fighters from the dataframe.\"\"\"\n        logger.info(\"Migrating fighters...\")\n        \n        # Get unique fighters from both fighter1 and fighter2 columns\n        fighter1_data = df[['fighter1', 'fighter1_height', 'fighter1_reach', \n                           'fighter1_stance', 'fighter1_dob']].copy()\n        fighter1_data.columns = ['name', 'height', 'reach', 'stance', 'dob']\n        \n        fighter2_data = df[['fighter2', 'fighter2_height', 'fighter2_reach', \n                           'fighter2_stance', 'fighter2_dob']].copy()\n        fighter2_data.columns = ['name', 'height', 'reach', 'stance', 'dob']\n        \n        # Combine and deduplicate\n        all_fighters = pd.concat([fighter1_data, fighter2_data], ignore_index=True)\n        all_fighters = all_fighters.drop_duplicates(subset=['name'])\n        \n        for _, fighter_row in all_fighters.iterrows():\n            try:\n                name = self.clean_string_value(fighter_row['name'])\n                if not name:\n                    continue\n                \n                height = self.extract_height_in_inches(fighter_row['height'])\n                reach = self.clean_numeric_value(fighter_row['reach'])\n                stance = self.clean_string_value(fighter_row['stance'])\n                dob = self.clean_date_value(fighter_row['dob'])\n                \n                fighter_id = self.dal.insert_fighter(\n                    name=name,\n                    height=height,\n                    reach=reach,\n                    stance=stance,\n                    date_of_birth=dob\n                )\n                self.migration_stats['fighters'] += 1\n                logger.debug(f\"Inserted fighter: {name} (ID: {fighter_id})\")\n                \n            except Exception as e:\n                error_msg = f\"Error inserting fighter {fighter_row.get('name', 'Unknown')}: {e}\"\n                logger.error(error_msg)\n                self.migration_stats['errors'].append(error_msg)\n        \n        logger.info(f\"Migrated {self.migration_stats['fighters']} fighters\")\n    \n    def migrate_events(self, df: pd.DataFrame):\n        \"\"\"Migrate events from the dataframe.\"\"\"\n        logger.info(\"Migrating events...\")\n        \n        # Get unique events\n        unique_events = df[['event_name', 'event_date']].drop_duplicates()\n        \n        for _, event_row in unique_events.iterrows():\n            try:\n                name = self.clean_string_value(event_row['event_name'])\n                date = self.clean_date_value(event_row['event_date'])\n                \n                if not name or not date:\n                    continue\n                \n                event_id = self.dal.insert_event(\n                    name=name,\n                    date=date\n                )\n                self.migration_stats['events'] += 1\n                logger.debug(f\"Inserted event: {name} on {date} (ID: {event_id})\")\n                \n            except Exception as e:\n                error_msg = f\"Error inserting event {event_row.get('event_name', 'Unknown')}: {e}\"\n                logger.error(error_msg)\n                self.migration_stats['errors'].append(error_msg)\n        \n        logger.info(f\"Migrated {self.migration_stats['events']} events\")\n    \n    def migrate_complete_data(self, csv_file_path: str):\n        \"\"\"Migrate data from the complete UFC dataset CSV.\"\"\"\n        logger.info(f\"Starting migration from {csv_file_path}\")\n        \n        try:\n            # Load the CSV file\n            df = pd.read_csv(csv_file_path)\n            logger.info(f\"Loaded {len(df)} rows from CSV\")\n            \n            # Migrate in order (due to foreign key dependencies)\n            self.migrate_weight_classes(df)\n            self.migrate_fighters(df)\n            self.migrate_events(df)\n            # Additional migration methods would go here\n            \n            # Record the data extract\n            self.record_data_extract('complete_migration', csv_file_path, len(df))\n            \n            logger.info(\"Migration completed successfully!\")\n            self.print_migration_summary()\n            \n        except Exception as e:\n            logger.error(f\"Migration failed: {e}\")\n            raise\n    \n    def record_data_extract(self, extract_type: str, source_file: str, records_processed: int):\n        \"\"\"Record information about the data extract.\"\"\"\n        query = \"\"\"\n        INSERT INTO data_extracts (extract_type, extract_timestamp, source_file, records_processed)\n        VALUES (?, ?, ?, ?)\n        \"\"\"\n        self.dal.db.execute_query(query, (\n            extract_type, \n            datetime.now().isoformat(), \n            source_file, \n            records_processed\n        ))\n        self.dal.db.commit()\n    \n    def print_migration_summary(self):\n        \"\"\"Print a summary of the migration results.\"\"\"\n        print(\"\\n\" + \"=\"*50)\n        print(\"MIGRATION SUMMARY\")\n        print(\"=\"*50)\n        print(f\"Weight Classes: {self.migration_stats['weight_classes']}\")\n        print(f\"Fighters: {self.migration_stats['fighters']}\")\n        print(f\"Events: {self.migration_stats['events']}\")\n        print(f\"Fights: {self.migration_stats['fights']}\")\n        print(f\"Fighter Stats: {self.migration_stats['fighter_stats']}\")\n        print(f\"Betting Odds: {self.migration_stats['betting_odds']}\")\n        print(f\"Errors: {len(self.migration_stats['errors'])}\")\n        \n        if self.migration_stats['errors']:\n            print(\"\\nERRORS:\")\n            for error in self.migration_stats['errors'][:10]:  # Show first 10 errors\n                print(f\"  - {error}\")\n            if len(self.migration_stats['errors']) > 10:\n                print(f\"  ... and {len(self.migration_stats['errors']) - 10} more errors\")\n        \n        print(\"=\"*50)\n\n\ndef main():\n    \"\"\"Main migration function.\"\"\"\n    # Set up database\n    db_path = \"ufc_data.db\"\n    \n    # Run migration\n    migrator = UFCDataMigrator(db_path, \".\")\n    try:\n        csv_file = \"complete_ufc_data.csv\"\n        if not os.path.exists(csv_file):\n            logger.error(f\"CSV file not found: {csv_file}\")\n            return\n        \n        migrator.migrate_complete_data(csv_file)\n        \n    except Exception as e:\n        logger.error(f\"Migration failed: {e}\")\n    finally:\n        migrator.close()\n\n\nif __name__ == \"__main__\":\n    main()\n
\ No newline at end of file
+"""
+UFC Data Migration Script
+========================
+
+This script migrates existing CSV data from the UFC project into the SQLite database.
+It handles data cleaning, validation, and proper relationship mapping.
+"""
+
+import pandas as pd
+import numpy as np
+from contextlib import contextmanager
+from datetime import datetime, date
+import logging
+import os
+import sys
+from typing import Dict, List, Optional, Tuple
+import re
+
+from database_schema import UFCDatabase
+from data_access_layer import UFCDataAccess
+from config import MIGRATION_CONFIG
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Feet and inches height pattern used by extract_height_in_inches
+FEET_INCHES_RE = re.compile(r"(\d+)'\s*(\d+)")
+
+
+class UFCDataMigrator:
+    """Handles migration of CSV data to the UFC database."""
+    
+    def __init__(self, db_path: str = "ufc_data.db", data_dir: str = ".",
+                 create_indexes: bool = True, batch_size: Optional[int] = None,
+                 db: Optional[UFCDatabase] = None):
+        """Initialize the migrator.
+        
+        Pass create_indexes=False when loading into fresh tables and building
+        the indexes after the load. batch_size is the number of rows sent per
+        executemany call (defaults to MIGRATION_CONFIG['batch_size']). Pass an
+        open UFCDatabase as db to migrate over its connection rather than
+        opening a new one; it is left open by close().
+        """
+        self.db_path = db_path
+        self.data_dir = data_dir
+        if batch_size is None:
+            batch_size = MIGRATION_CONFIG['batch_size']
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+        self.batch_size = batch_size
+        
+        # Initialize database schema first
+        schema_db = UFCDatabase(db_path) if db is None else db
+        try:
+            schema_db.create_tables()
+            if create_indexes:
+                schema_db.create_indexes()
+            logger.info("Database schema initialized for migration")
+        except Exception as e:
+            logger.error(f"Failed to initialize database schema: {e}")
+            raise
+        finally:
+            if db is None:
+                schema_db.close()
+        
+        # Now initialize data access layer
+        self.dal = UFCDataAccess(db_path, db=db)
+        
+        # Track inserted records for reporting
+        self.migration_stats = {
+            'fighters': 0,
+            'weight_classes': 0,
+            'events': 0,
+            'fights': 0,
+            'fighter_stats': 0,
+            'betting_odds': 0,
+            'errors': []
+        }
+    
+    def close(self):
+        """Close database connection."""
+        self.dal.close()
+    
+    @contextmanager
+    def bulk_load(self):
+        """Tune the connection for bulk loading and run the block as one transaction.
+
+        WAL and synchronous=NORMAL only last for the load; afterwards the
+        database goes back to the journal mode it had before, with
+        synchronous=FULL.
+        """
+        db = self.dal.db
+        journal_mode = db.execute_query("PRAGMA journal_mode").fetchone()[0]
+        db.set_pragmas(MIGRATION_CONFIG['bulk_load_pragmas'])
+        try:
+            with db.transaction():
+                yield self
+        finally:
+            db.set_pragmas({
+                **MIGRATION_CONFIG['post_load_pragmas'],
+                'journal_mode': journal_mode
+            })
+    
+    def clean_numeric_value(self, value) -> Optional[float]:
+        """Clean and convert numeric values."""
+        if pd.isna(value) or value == '' or value == 'NaN':
+            return None
+        try:
+            return float(value)
+        except (ValueError, TypeError):
+            return None
+    
+    def clean_string_value(self, value) -> Optional[str]:
+        """Clean and convert string values."""
+        if pd.isna(value) or value == '' or value == 'NaN':
+            return None
+        return str(value).strip()
+    
+    def clean_date_value(self, value) -> Optional[str]:
+        """Clean and convert date values."""
+        if pd.isna(value) or value == '' or value == 'NaN':
+            return None
+        
+        try:
+            # Try to parse the date and return in YYYY-MM-DD format
+            if isinstance(value, str):
+                # Handle various date formats
+                parsed_date = pd.to_datetime(value)
+                return parsed_date.strftime('%Y-%m-%d')
+            elif hasattr(value, 'strftime'):
+                return value.strftime('%Y-%m-%d')
+            else:
+                return str(value)
+        except:
+            logger.warning(f"Could not parse date: {value}")
+            return None
+    
+    def clean_column(self, series: pd.Series, fast_values: pd.Series, clean_value) -> pd.Series:
+        """Combine a vectorised cleaning pass with a per-value fallback.
+        
+        Values the vectorised pass could not convert are cleaned one at a time
+        with clean_value, so only dirty values pay for a Python-level call.
+        """
+        cleaned = fast_values.astype(object).where(fast_values.notna(), None)
+        dirty = fast_values.isna() & series.notna()
+        if dirty.any():
+            cleaned[dirty] = series[dirty].map(clean_value)
+        return cleaned
+    
+    def clean_numeric_column(self, series: pd.Series) -> pd.Series:
+        """Clean and convert a column of numeric values."""
+        return self.clean_column(
+            series, pd.to_numeric(series, errors='coerce'), self.clean_numeric_value
+        )
+    
+    def clean_string_column(self, series: pd.Series) -> pd.Series:
+        """Clean and convert a column of string values."""
+        if not pd.api.types.is_numeric_dtype(series):
+            fast_values = series.str.strip().replace({'': np.nan, 'NaN': np.nan})
+        else:
+            fast_values = pd.Series(np.nan, index=series.index)
+        return self.clean_column(series, fast_values, self.clean_string_value)
+    
+    def clean_date_column(self, series: pd.Series) -> pd.Series:
+        """Clean and convert a column of date values to YYYY-MM-DD."""
+        fast_values = pd.to_datetime(series, format='%Y-%m-%d', errors='coerce').dt.strftime('%Y-%m-%d')
+        return self.clean_column(series, fast_values, self.clean_date_value)
+    
+    def extract_height_in_inches(self, height_str) -> Optional[float]:
+        """Extract height in inches from various formats."""
+        if not height_str or pd.isna(height_str):
+            return None
+        
+        height_str = str(height_str).strip()
+        
+        # Handle format like "5' 11\"" or "5'11\""
+        match = FEET_INCHES_RE.search(height_str)
+        if match:
+            feet = int(match.group(1))
+            inches = int(match.group(2))
+            return feet * 12 + inches
+        
+        # Handle format like "71" (already in inches)
+        if height_str.replace('.', '').isdigit():
+            return float(height_str)
+        
+        return None
+    
+    def parse_weight_class_gender(self, weight_class: str) -> str:
+        """Determine gender from weight class name."""
+        if not weight_class:
+            return 'Mixed'
+        
+        weight_class_lower = weight_class.lower()
+        if "women's" in weight_class_lower:
+            return 'Female'
+        elif "men's" in weight_class_lower:
+            return 'Male'
+        else:
+            return 'Mixed'
+    
+    def insert_in_batches(self, query: str, rows: List[tuple], label: str) -> int:
+        """Insert rows with executemany in batches of self.batch_size.
+        
+        One cursor and one SQL string are reused for every batch, so the
+        statement is prepared once and only rebound per row. Nothing is
+        committed here; the migration commits once when the data extract is
+        recorded.
+        
+        Each batch runs under a savepoint. If it fails, the partial batch is
+        rolled back and its rows are retried one at a time, so only the rows
+        that actually fail are skipped and recorded in the migration errors.
+        A transaction is opened first if none is, since releasing an outermost
+        savepoint would commit each batch.
+        
+        Returns the number of rows written to the database.
+        """
+        connection = self.dal.db.connection
+        cursor = connection.cursor()
+        if not connection.in_transaction:
+            cursor.execute("BEGIN")
+        inserted = 0
+        for start in range(0, len(rows), self.batch_size):
+            batch = rows[start:start + self.batch_size]
+            cursor.execute("SAVEPOINT insert_batch")
+            try:
+                cursor.executemany(query, batch)
+                inserted += cursor.rowcount
+            except Exception as e:
+                logger.warning(f"Batch of {label} rows {start}-{start + len(batch) - 1} failed ({e}), retrying row by row")
+                cursor.execute("ROLLBACK TO insert_batch")
+                for offset, row in enumerate(batch, start):
+                    try:
+                        cursor.execute(query, row)
+                        inserted += cursor.rowcount
+                    except Exception as e:
+                        error_msg = f"Error inserting {label} row {offset}: {e}"
+                        logger.error(error_msg)
+                        self.migration_stats['errors'].append(error_msg)
+            finally:
+                cursor.execute("RELEASE insert_batch")
+        return inserted
+    
+    def migrate_weight_classes(self, df: pd.DataFrame):
+        """Migrate weight classes from the dataframe."""
+        logger.info("Migrating weight classes...")
+        
+        unique_weight_classes = df['weight_class'].dropna().unique()
+        
+        rows = [
+            (weight_class, None, self.parse_weight_class_gender(weight_class))
+            for weight_class in unique_weight_classes
+        ]
+        
+        query = """
+        INSERT OR IGNORE INTO weight_classes (name, weight_limit, gender)
+        VALUES (?, ?, ?)
+        """
+        self.migration_stats['weight_classes'] += self.insert_in_batches(query, rows, 'weight class')
+        
+        logger.info(f"Migrated {self.migration_stats['weight_classes']} weight classes")
+    
+    def migrate_fighters(self, df: pd.DataFrame):
+        """Migrate fighters from the dataframe."""
+        logger.info("Migrating fighters...")
+        
+        # Get unique fighters from both fighter1 and fighter2 columns
+        fighter1_data = df[['fighter1', 'fighter1_height', 'fighter1_reach', 
+                           'fighter1_stance', 'fighter1_dob']].copy()
+        fighter1_data.columns = ['name', 'height', 'reach', 'stance', 'dob']
+        
+        fighter2_data = df[['fighter2', 'fighter2_height', 'fighter2_reach', 
+                           'fighter2_stance', 'fighter2_dob']].copy()
+        fighter2_data.columns = ['name', 'height', 'reach', 'stance', 'dob']
+        
+        # Combine and deduplicate
+        all_fighters = pd.concat([fighter1_data, fighter2_data], ignore_index=True)
+        all_fighters = all_fighters.drop_duplicates(subset=['name'])
+        
+        # Columns that are already clean convert in one vectorised pass; only
+        # values that fail it go through the per-value cleaners
+        fighters = pd.DataFrame({
+            'name': self.clean_string_column(all_fighters['name']),
+            'height': self.clean_column(
+                all_fighters['height'],
+                pd.to_numeric(all_fighters['height'], errors='coerce'),
+                self.extract_height_in_inches
+            ),
+            'reach': self.clean_numeric_column(all_fighters['reach']),
+            'stance': self.clean_string_column(all_fighters['stance']),
+            'dob': self.clean_date_column(all_fighters['dob'])
+        })
+        fighters = fighters[fighters['name'].astype(bool)]
+        rows = list(fighters.itertuples(index=False, name=None))
+        
+        query = """
+        INSERT OR IGNORE INTO fighters (name, height, reach, stance, date_of_birth)
+        VALUES (?, ?, ?, ?, ?)
+        """
+        self.migration_stats['fighters'] += self.insert_in_batches(query, rows, 'fighter')
+        
+        logger.info(f"Migrated {self.migration_stats['fighters']} fighters")
+    
+    def migrate_events(self, df: pd.DataFrame):
+        """Migrate events from the dataframe."""
+        logger.info("Migrating events...")
+        
+        # Get unique events
+        unique_events = df[['event_name', 'event_date']].drop_duplicates()
+        
+        events = pd.DataFrame({
+            'name': self.clean_string_column(unique_events['event_name']),
+            'date': self.clean_date_column(unique_events['event_date']),
+            'location': None,
+            'venue': None
+        })
+        events = events[events['name'].astype(bool) & events['date'].astype(bool)]
+        rows = list(events.itertuples(index=False, name=None))
+        
+        query = """
+        INSERT OR IGNORE INTO events (name, date, location, venue)
+        VALUES (?, ?, ?, ?)
+        """
+        self.migration_stats['events'] += self.insert_in_batches(query, rows, 'event')
+        
+        logger.info(f"Migrated {self.migration_stats['events']} events")
+    
+    def migrate_complete_data(self, csv_file_path: str):
+        """Migrate data from the complete UFC dataset CSV."""
+        logger.info(f"Starting migration from {csv_file_path}")
+        
+        try:
+            # Load the CSV file
+            df = pd.read_csv(csv_file_path)
+            logger.info(f"Loaded {len(df)} rows from CSV")
+            
+            # Migrate in order (due to foreign key dependencies)
+            self.migrate_weight_classes(df)
+            self.migrate_fighters(df)
+            self.migrate_events(df)
+            # Additional migration methods would go here
+            
+            # Record the data extract
+            self.record_data_extract('complete_migration', csv_file_path, len(df))
+            
+            logger.info("Migration completed successfully!")
+            self.print_migration_summary()
+            
+        except Exception as e:
+            logger.error(f"Migration failed: {e}")
+            raise
+    
+    def record_data_extract(self, extract_type: str, source_file: str, records_processed: int):
+        """Record information about the data extract."""
+        query = """
+        INSERT INTO data_extracts (extract_type, extract_timestamp, source_file, records_processed)
+        VALUES (?, ?, ?, ?)
+        """
+        self.dal.db.execute_query(query, (
+            extract_type, 
+            datetime.now().isoformat(), 
+            source_file, 
+            records_processed
+        ))
+        self.dal.db.commit()
+    
+    def print_migration_summary(self):
+        """Print a summary of the migration results."""
+        print("\n" + "="*50)
+        print("MIGRATION SUMMARY")
+        print("="*50)
+        print(f"Weight Classes: {self.migration_stats['weight_classes']}")
+        print(f"Fighters: {self.migration_stats['fighters']}")
+        print(f"Events: {self.migration_stats['events']}")
+        print(f"Fights: {self.migration_stats['fights']}")
+        print(f"Fighter Stats: {self.migration_stats['fighter_stats']}")
+        print(f"Betting Odds: {self.migration_stats['betting_odds']}")
+        print(f"Errors: {len(self.migration_stats['errors'])}")
+        
+        if self.migration_stats['errors']:
+            print("\nERRORS:")
+            for error in self.migration_stats['errors'][:10]:  # Show first 10 errors
+                print(f"  - {error}")
+            if len(self.migration_stats['errors']) > 10:
+                print(f"  ... and {len(self.migration_stats['errors']) - 10} more errors")
+        
+        print("="*50)
+
+
+def main():
+    """Main migration function."""
+    # Set up database
+    db_path = "ufc_data.db"
+    
+    # Run migration
+    migrator = UFCDataMigrator(db_path, ".")
+    try:
+        csv_file = "complete_ufc_data.csv"
+        if not os.path.exists(csv_file):
+            logger.error(f"CSV file not found: {csv_file}")
+            return
+        
+        migrator.migrate_complete_data(csv_file)
+        
+    except Exception as e:
+        logger.error(f"Migration failed: {e}")
+    finally:
+        migrator.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+UFC Database Utilities
+======================
+
+Maintenance helpers for the UFC database.
+"""
+
+import logging
+import os
+import sqlite3
+import subprocess
+import sys
+
+logger = logging.getLogger(__name__)
+
+
+def backup_database(db_path: str, backup_path: str):
+    """Back up the database file to backup_path.
+
+    Uses a copy-on-write clone where the filesystem supports it (Btrfs, XFS,
+    etc.), which is near-instant regardless of size. Otherwise falls back to
+    SQLite's online backup API, which gives a consistent copy even when a
+    journal or WAL file is present.
+    """
+    if _clone_file(db_path, backup_path):
+        logger.info(f"Cloned database {db_path} to {backup_path}")
+        return
+
+    source = sqlite3.connect(db_path)
+    try:
+        target = sqlite3.connect(backup_path)
+        try:
+            source.backup(target)
+        finally:
+            target.close()
+    finally:
+        source.close()
+    logger.info(f"Backed up database {db_path} to {backup_path}")
+
+
+def _clone_file(src: str, dst: str) -> bool:
+    """Reflink src to dst, returning False if that isn't possible."""
+    if not sys.platform.startswith('linux'):
+        return False
+
+    # A file-level copy would miss changes still held in the journal or WAL
+    if any(os.path.exists(src + suffix) for suffix in ('-journal', '-wal')):
+        return False
+
+    result = subprocess.run(
+        ['cp', '--reflink=always', src, dst],
+        capture_output=True
+    )
+    return result.returncode == 0
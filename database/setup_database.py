@@ -8,6 +8,7 @@ and data migration from existing CSV files.
 
 Usage:
     python setup_database.py [--db-path DATABASE_PATH] [--data-file CSV_FILE]
+                             [--keep-indexes] [--batch-size N]
 """
 
 import argparse
@@ -21,7 +22,7 @@ sys.path.append(str(Path(__file__).parent))
 
 from database_schema import UFCDatabase
 from data_migration import UFCDataMigrator
-from config import get_db_path, get_backup_path
+from config import get_db_path, get_backup_path, MIGRATION_CONFIG
 from database_utils import backup_database
 
 # Configure logging
@@ -32,42 +33,69 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def setup_database(db_path: str, data_file: str = None, backup_existing: bool = True):
-    """Set up the UFC database with schema and data."""
+def positive_int(value: str) -> int:
+    """argparse type for options that must be a whole number of at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def setup_database(db_path: str, data_file: str = None, backup_existing: bool = True,
+                   defer_indexes: bool = True, batch_size: int = None):
+    """Set up the UFC database with schema and data.
+    
+    When data is migrated and defer_indexes is set, indexes are built once on
+    the populated tables instead of being updated by every insert.
+    """
+    load_data = bool(data_file) and os.path.exists(data_file)
+    defer_indexes = defer_indexes and load_data
     
     # Backup existing database if it exists
     if backup_existing and os.path.exists(db_path):
         backup_path = get_backup_path(db_path)
         backup_database(db_path, backup_path)
-        logger.info(f"Backed up existing database to {backup_path}")
     
-    # Initialize database schema
+    # One connection is shared by schema creation, migration and index
+    # creation so its page cache and PRAGMA settings carry through
     logger.info("Creating database schema...")
     db = UFCDatabase(db_path)
     try:
-        db.create_tables()
-        db.create_indexes()
-        logger.info("Database schema created successfully")
-    except Exception as e:
-        logger.error(f"Failed to create database schema: {e}")
-        raise
-    finally:
-        db.close()
-    
-    # Migrate data if CSV file provided
-    if data_file and os.path.exists(data_file):
-        logger.info(f"Migrating data from {data_file}...")
-        migrator = UFCDataMigrator(db_path, ".")
         try:
-            migrator.migrate_complete_data(data_file)
-            logger.info("Data migration completed successfully")
+            db.create_tables()
+            if not defer_indexes:
+                db.create_indexes()
+            logger.info("Database schema created successfully")
         except Exception as e:
-            logger.error(f"Data migration failed: {e}")
+            logger.error(f"Failed to create database schema: {e}")
             raise
-        finally:
-            migrator.close()
-    elif data_file:
-        logger.warning(f"Data file not found: {data_file}")
+        
+        # Migrate data if CSV file provided
+        if load_data:
+            logger.info(f"Migrating data from {data_file}...")
+            migrator = UFCDataMigrator(
+                db_path, ".",
+                create_indexes=not defer_indexes,
+                batch_size=batch_size,
+                db=db
+            )
+            try:
+                with migrator.bulk_load():
+                    migrator.migrate_complete_data(data_file)
+                logger.info("Data migration completed successfully")
+            except Exception as e:
+                logger.error(f"Data migration failed: {e}")
+                raise
+            finally:
+                migrator.close()
+            
+            if defer_indexes:
+                logger.info("Creating indexes on populated tables...")
+                db.create_indexes()
+        elif data_file:
+            logger.warning(f"Data file not found: {data_file}")
+    finally:
+        db.close()
     
     logger.info(f"Database setup complete: {db_path}")
 
@@ -95,6 +123,17 @@ def main():
         action="store_true",
         help="Only create schema, don't migrate data"
     )
+    parser.add_argument(
+        "--keep-indexes",
+        action="store_true",
+        help="Create indexes with the schema instead of after the data load"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=positive_int,
+        default=MIGRATION_CONFIG['batch_size'],
+        help=f"Rows per batched insert (default: {MIGRATION_CONFIG['batch_size']})"
+    )
     
     args = parser.parse_args()
     
@@ -103,7 +142,9 @@ def main():
         setup_database(
             db_path=args.db_path,
             data_file=data_file,
-            backup_existing=not args.no_backup
+            backup_existing=not args.no_backup,
+            defer_indexes=not args.keep_indexes,
+            batch_size=args.batch_size
         )
         
         print("\n" + "="*50)
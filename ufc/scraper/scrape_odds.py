@@ -15,28 +15,52 @@ as well as significant updates to logic which was no longer working correctly  f
 import pandas as pd
 import numpy as np
 import datetime
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from lxml import etree, html
 
 from ufc import utils
 
+# pages fetched within the last hour are served from a local SQLite cache on
+# re-runs - pass use_cache=False to OddsScraper to always hit the site
+HTTP_CACHE_PATH = "./data/http_cache.sqlite"
+HTTP_CACHE_EXPIRY = 3600  # seconds
+
+# "td td td td a" on the index page - every event link sits in 4+ nested tds
+EVENT_LINK_XPATH = etree.XPath("//a[count(ancestor::td) >= 4]")
+
+ODDS_COLUMNS = [
+    "link", "date", "event", "fighter1", "fighter2", "fighter1_odds", "fighter2_odds", "result"
+]
+
 class OddsScraper():
     """Scrape historic odds from betmma.tips"""
-    def __init__(self, test=False):
+    def __init__(self, test=False, max_workers=None, use_cache=True):
         self.test = test
+        self.use_cache = use_cache
         self.all_url = "https://www.betmma.tips/past_mma_handicapper_performance_all.php?Org=1"
         self.event_links = None
         self.event_odds = None
         self.curr_time = datetime.datetime.now()
+        # Event pages are fetched concurrently, but request start times are
+        # still spaced out across all workers to stay polite to the site
+        self.max_workers = max_workers or min(8, (os.cpu_count() or 1) * 2)
+        self.rate_limiter = utils.RateLimiter()
+        self.session = self._create_session()
 
     def get_individual_event_urls(self):
         """Get all individual urls"""
-        response = requests.get(self.all_url)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        response = self.session.get(self.all_url)
+        tree = html.fromstring(response.text)
 
         links = [
-                    f"http://www.betmma.tips/{a['href']}" for a in soup.select("td td td td a")
+                    f"http://www.betmma.tips/{a.get('href')}" for a in EVENT_LINK_XPATH(tree)
                 ]
         
         # Also scrape full table to fetch dates as well - we need this
@@ -53,28 +77,49 @@ class OddsScraper():
         table = table[
             table.Event.str.contains("UFC") &
             ~table.Event.str.contains("Road to UFC")
-        ].reset_index()
+        ]
 
-        self.event_links = table
+        # only ever iterated over - keep as plain dicts rather than a DataFrame
+        self.event_links = table.to_dict("records")
 
     def scrape_all_event_odds(self):
         """Iterate over all individual urls to scrape odds"""
 
-        scraped_results = []
+        event_links = self.event_links
+
+        scraped_results = [None] * len(event_links)
 
-        table = self.event_links
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._scrape_event_odds_page, row["url"], row["Date"]): i
+                for i, row in enumerate(event_links)
+            }
 
-        for i, row in table.iterrows():
-            print(f"{i+1}/{len(table)} - {row.Date} - {row.url}")
+            try:
+                for n_done, future in enumerate(as_completed(futures)):
+                    i = futures[future]
+                    row = event_links[i]
+                    print(f"{n_done+1}/{len(event_links)} - {row['Date']} - {row['url']}")
 
-            results = self._scrape_event_odds_page(row.url)
-            results["link"] = row.url
-            results["date"] = row.Date
-            scraped_results.append(results)
+                    # keep event order stable regardless of completion order
+                    scraped_results[i] = future.result()
+            except BaseException:
+                # don't keep scraping the remaining pages once one has failed
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
 
-            utils.sleep_randomly()
+        # Collect plain column lists and build the DataFrame once rather than
+        # concatenating one small DataFrame per event
+        columns = {col: [] for col in ODDS_COLUMNS}
+        for results in scraped_results:
+            for col, values in results.items():
+                columns[col].extend(values)
 
-        odds_df = pd.concat(scraped_results).reset_index(drop=True)
+        # float32 is plenty for 2dp decimal odds
+        for col in ["fighter1_odds", "fighter2_odds"]:
+            columns[col] = np.asarray(columns[col], dtype=np.float32)
+
+        odds_df = pd.DataFrame(columns)
 
         odds_df["timestamp"] = self.curr_time
 
@@ -83,10 +128,86 @@ class OddsScraper():
     def write_data(self):
         self.event_odds.to_csv("./data/odds_raw.csv", index=False)
 
-    def _scrape_event_odds_page(self, link):
+    def _create_session(self):
+        """Shared session so connections are kept alive and reused across requests"""
+        if self.use_cache:
+            session = requests_cache.CachedSession(
+                HTTP_CACHE_PATH,
+                expire_after=HTTP_CACHE_EXPIRY,
+                allowable_methods=("GET",),
+                allowable_codes=(200,)
+            )
+        else:
+            session = requests.Session()
+
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=max(16, self.max_workers),
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        return session
+
+    def _get_politely(self, url):
+        """GET a page, only waiting on the rate limiter when it isn't already cached"""
+        if self.use_cache:
+            response = self.session.get(url, only_if_cached=True)
+            if response.status_code != 504:
+                return response
+
+        self.rate_limiter.wait()
+
+        return self.session.get(url)
+
+    def _parse_event_page(self, text):
+        """
+        Stream through an event page once, picking out the elements we need as
+        they are parsed rather than querying the finished tree:
+        - fighter profile links
+        - event title ("td h1")
+        - odds labels ("td tr+ tr td" cells like "@1.65")
+
+        Takes the decoded page text so the charset from the response headers
+        is honoured - left to itself libxml2 reads pages without a meta
+        charset as Latin-1.
+        """
+        fighters = []
+        event_title = None
+        labels = []
+
+        for _, el in etree.iterparse(
+            io.BytesIO(text.encode("utf-8")), events=("end",), tag=("a", "h1", "td"),
+            html=True, encoding="utf-8"
+        ):
+            if el.tag == "a":
+                if "fighter_profile" in el.get("href", ""):
+                    fighters.append("".join(el.itertext()))
+
+            elif el.tag == "h1":
+                if event_title is None and _has_ancestor(el, "td"):
+                    event_title = "".join(el.itertext())
+
+            else:
+                # Label
+                # Exact match is "td td td td tr~ tr+ tr td" but this
+                # is very slow especially on large pages
+                # This is less precise but works on pages I tested
+                text = "".join(el.itertext())
+                if (len(text) <= 7) and "@" in text and _in_odds_row(el):
+                    labels.append(text)
+
+        return fighters, event_title, labels
 
-        sub_response = requests.get(link)
-        sub_soup = BeautifulSoup(sub_response.text, 'html.parser')
+    def _scrape_event_odds_page(self, link, date=np.nan) -> dict[str, list]:
+
+        sub_response = self._get_politely(link)
+
+        fighters, event_t, label_t = self._parse_event_page(sub_response.text)
+
+        if event_t is None:
+            raise ValueError(f"No event title found on {link}")
 
         event = []
         fighter1 = []
@@ -103,9 +224,6 @@ class OddsScraper():
         # - Next should give result - but where it is neither fighter1 or fighter2 
         #   and is a new fighter, this is because a draw or N/C was returned
         #   so assume it is a new fighter1
-        fighters = [a.get_text() for a in sub_soup.select("a") \
-                    if "fighter_profile" in a.get("href")]
-
         increment = "fighter1"
 
         for i in fighters:
@@ -133,20 +251,8 @@ class OddsScraper():
             result.append("-")
 
         # Event
-        event_t = sub_soup.select("td h1")[0].get_text()
         event.extend([event_t] * len(fighter1))
 
-        # Label
-        # Exact match is sub_soup.select("td td td td tr~ tr+ tr td") but this
-        # is very slow especially on large pages
-        # This is less precise but works on pages I tested
-        label_t = [
-                    td.get_text() for td in sub_soup.select("td tr+ tr td") \
-                    if (len(td.get_text()) <= 7) and \
-                        "@" in td.get_text()
-                ]
-
-
         label_cleansed = [t.replace("@", "").strip() for t in label_t]
 
         # Fighter1 odds
@@ -157,16 +263,42 @@ class OddsScraper():
         fighter2_odds_t = label_cleansed[1::2]
         fighter2_odds.extend(fighter2_odds_t)
 
-        return pd.DataFrame({
-            "link": np.nan,
-            "date": np.nan,
+        # mismatched lengths mean the page layout wasn't parsed correctly
+        n_fights = len(fighter1)
+        if any(len(col) != n_fights for col in [fighter2, fighter1_odds, fighter2_odds, result]):
+            raise ValueError(f"Mismatched fighters, odds and results scraped from {link}")
+
+        # odds that aren't numbers also mean the layout has changed - fail
+        # rather than writing them out as NaN
+        try:
+            fighter1_odds = [float(odds) for odds in fighter1_odds]
+            fighter2_odds = [float(odds) for odds in fighter2_odds]
+        except ValueError as e:
+            raise ValueError(f"Non-numeric odds scraped from {link}: {e}") from e
+
+        return {
+            "link": [link] * n_fights,
+            "date": [date] * n_fights,
             "event": event,
             "fighter1": fighter1,
             "fighter2": fighter2,
             "fighter1_odds": fighter1_odds,
             "fighter2_odds": fighter2_odds,
             "result": result
-        })
+        }
+
 
+def _has_ancestor(el, tag):
+    return next(el.iterancestors(tag), None) is not None
 
 
+def _in_odds_row(td):
+    """True if td sits in a "td tr+ tr" row - a tr directly after another tr, inside a td"""
+    for tr in td.iterancestors("tr"):
+        prev = tr.getprevious()
+        # skip comments etc. - CSS sibling selectors only consider elements
+        while prev is not None and not isinstance(prev.tag, str):
+            prev = prev.getprevious()
+        if prev is not None and prev.tag == "tr" and _has_ancestor(tr, "td"):
+            return True
+    return False
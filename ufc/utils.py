@@ -1,6 +1,7 @@
 import requests
 from bs4 import BeautifulSoup
 import numpy as np
+import threading
 import time
 
 def get_soup(url):
@@ -13,3 +14,24 @@ def sleep_randomly():
     """Sleep for some random time between requests"""
     sleep_time = np.random.uniform(2,4)
     time.sleep(sleep_time)
+
+
+class RateLimiter():
+    """
+    Thread-safe equivalent of sleep_randomly for concurrent scrapers
+    Spaces out request start times by a random 2-4 seconds across all threads
+    """
+
+    def __init__(self, min_interval=2, max_interval=4):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+
+    def wait(self):
+        """Block until this caller is allowed to send its request"""
+        with self._lock:
+            delay = self._next_time - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self._next_time = time.monotonic() + np.random.uniform(self.min_interval, self.max_interval)